@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Build all fixture PDFs for testing the AI pipeline in parallel
+"""
+from concurrent.futures import ProcessPoolExecutor
+import importlib.util
+import os
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# (script, entry point) for each fixture PDF
+FIXTURE_BUILDERS = (
+    ("create-company-handbook.py", "create_company_handbook"),
+    ("create-test-pdf.py", "create_test_pdf"),
+)
+
+def _invoke(builder):
+    # The scripts have hyphenated names, so load them by path in the worker
+    script, func_name = builder
+    spec = importlib.util.spec_from_file_location(
+        func_name, os.path.join(SCRIPT_DIR, script))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    getattr(module, func_name)()
+
+def build_all():
+    workers = min(len(FIXTURE_BUILDERS), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        list(ex.map(_invoke, FIXTURE_BUILDERS))
+
+if __name__ == "__main__":
+    build_all()
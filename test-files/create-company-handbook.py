@@ -3,73 +3,102 @@
 Create a sample company handbook PDF for testing the AI pipeline
 """
 from reportlab.pdfgen import canvas
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.lib.enums import TA_CENTER
 from reportlab.lib.units import inch
-import os
+from pathlib import Path
+import io
 
-def create_company_handbook():
-    filename = "sample_company_handbook.pdf"
-    doc = SimpleDocTemplate(filename, pagesize=letter)
-    styles = getSampleStyleSheet()
-    
-    # Create custom styles
-    styles.add(ParagraphStyle(name='Heading1', 
-                             parent=styles['Heading1'], 
-                             fontSize=18,
-                             spaceAfter=12))
-    
-    styles.add(ParagraphStyle(name='Heading2', 
-                             parent=styles['Heading2'], 
-                             fontSize=14,
-                             spaceBefore=12,
-                             spaceAfter=6))
-    
-    styles.add(ParagraphStyle(name='Normal', 
-                             parent=styles['Normal'], 
-                             fontSize=10,
-                             spaceBefore=6,
-                             spaceAfter=6))
-    
-    # Content for the handbook
-    content = []
-    
+MARGIN = inch
+# Platypus frames pad their content by 6pt on every side; keep the same
+# text box so the fixture's line and page breaks stay as they were
+FRAME_PADDING = 6
+FRAME_X = MARGIN + FRAME_PADDING
+FRAME_WIDTH = letter[0] - 2 * (MARGIN + FRAME_PADDING)
+FRAME_TOP = letter[1] - MARGIN - FRAME_PADDING
+FRAME_BOTTOM = MARGIN + FRAME_PADDING
+
+# Load metrics for the only two fonts the handbook uses up front
+for _font_name in ("Helvetica", "Helvetica-Bold"):
+    pdfmetrics.getFont(_font_name)
+
+def _build_styles():
+    # Built from scratch rather than via getSampleStyleSheet(), which
+    # would construct a dozen styles this script never uses
+    return {
+        'Title': ParagraphStyle(name='Title',
+                                fontName='Helvetica-Bold',
+                                fontSize=18,
+                                leading=22,
+                                alignment=TA_CENTER,
+                                # Own 6pt, the old 0.25in Spacer and the
+                                # 6pt spaceBefore of the date paragraph
+                                spaceAfter=0.25*inch + 12),
+        'Subtitle': ParagraphStyle(name='Subtitle',
+                                   fontName='Helvetica',
+                                   fontSize=10,
+                                   leading=12,
+                                   spaceAfter=0.5*inch + 6),
+        'Heading1': ParagraphStyle(name='Heading1',
+                                   fontName='Helvetica-Bold',
+                                   fontSize=18,
+                                   leading=22,
+                                   spaceAfter=12),
+        'Heading2': ParagraphStyle(name='Heading2',
+                                   fontName='Helvetica-Bold',
+                                   fontSize=14,
+                                   leading=18,
+                                   spaceBefore=12,
+                                   spaceAfter=6),
+        'Normal': ParagraphStyle(name='Normal',
+                                 fontName='Helvetica',
+                                 fontSize=10,
+                                 leading=12,
+                                 spaceBefore=6,
+                                 spaceAfter=6),
+    }
+
+# Styles are built once per process rather than on every call
+_STYLES = _build_styles()
+
+# Content for the handbook as (style_tag, text) blocks
+_HANDBOOK_SECTIONS = (
     # Title
-    content.append(Paragraph("TechCorp Employee Handbook", styles['Title']))
-    content.append(Spacer(1, 0.25*inch))
-    content.append(Paragraph("Effective Date: January 1, 2023", styles['Normal']))
-    content.append(Spacer(1, 0.5*inch))
+    ('Title', "TechCorp Employee Handbook"),
+    ('Subtitle', "Effective Date: January 1, 2023"),
     
     # Introduction
-    content.append(Paragraph("1. Introduction", styles['Heading1']))
-    content.append(Paragraph("""
+    ('Heading1', "1. Introduction"),
+    ('Normal', """
     Welcome to TechCorp! This handbook contains important information about our company policies, 
     benefits, and expectations. All employees are expected to familiarize themselves with the 
     contents of this handbook. This document is not a contract of employment and does not guarantee 
     employment for any specific duration.
-    """, styles['Normal']))
+    """),
     
     # Company Values
-    content.append(Paragraph("2. Company Values", styles['Heading1']))
-    content.append(Paragraph("""
+    ('Heading1', "2. Company Values"),
+    ('Normal', """
     At TechCorp, we believe in innovation, integrity, collaboration, and excellence. Our mission 
     is to create cutting-edge technology solutions that improve people's lives while maintaining 
     the highest ethical standards.
-    """, styles['Normal']))
+    """),
     
     # Employment Policies
-    content.append(Paragraph("3. Employment Policies", styles['Heading1']))
+    ('Heading1', "3. Employment Policies"),
     
-    content.append(Paragraph("3.1 Equal Employment Opportunity", styles['Heading2']))
-    content.append(Paragraph("""
+    ('Heading2', "3.1 Equal Employment Opportunity"),
+    ('Normal', """
     TechCorp is an equal opportunity employer. We do not discriminate based on race, color, 
     religion, gender, sexual orientation, gender identity, national origin, age, disability, 
     or any other protected characteristic.
-    """, styles['Normal']))
+    """),
     
-    content.append(Paragraph("3.2 Employment Classifications", styles['Heading2']))
-    content.append(Paragraph("""
+    ('Heading2', "3.2 Employment Classifications"),
+    ('Normal', """
     TechCorp classifies employees as follows:
     
     • Full-time: Employees who work 40 hours per week
@@ -77,31 +106,31 @@ def create_company_handbook():
     • Temporary: Employees hired for a specific project or time period
     • Exempt: Salaried employees who are not eligible for overtime pay
     • Non-exempt: Hourly employees who are eligible for overtime pay
-    """, styles['Normal']))
+    """),
     
     # Work Hours and Compensation
-    content.append(Paragraph("4. Work Hours and Compensation", styles['Heading1']))
+    ('Heading1', "4. Work Hours and Compensation"),
     
-    content.append(Paragraph("4.1 Work Hours", styles['Heading2']))
-    content.append(Paragraph("""
+    ('Heading2', "4.1 Work Hours"),
+    ('Normal', """
     Standard work hours are Monday through Friday, 9:00 AM to 5:00 PM. Flexible work arrangements 
     may be available depending on job requirements and manager approval.
     
     Part-time employees' schedules will be determined based on business needs and will be 
     communicated at the time of hire or when a change occurs.
-    """, styles['Normal']))
+    """),
     
-    content.append(Paragraph("4.2 Compensation", styles['Heading2']))
-    content.append(Paragraph("""
+    ('Heading2', "4.2 Compensation"),
+    ('Normal', """
     Employees are paid bi-weekly. Direct deposit is available and encouraged. Annual performance 
     reviews will be conducted to evaluate potential salary adjustments.
-    """, styles['Normal']))
+    """),
     
     # Leave Policies
-    content.append(Paragraph("5. Leave Policies", styles['Heading1']))
+    ('Heading1', "5. Leave Policies"),
     
-    content.append(Paragraph("5.1 Vacation Leave", styles['Heading2']))
-    content.append(Paragraph("""
+    ('Heading2', "5.1 Vacation Leave"),
+    ('Normal', """
     Full-time employees accrue vacation leave as follows:
     • 0-2 years of service: 10 days per year
     • 3-5 years of service: 15 days per year
@@ -112,10 +141,10 @@ def create_company_handbook():
     of service would accrue 5 days per year.
     
     Vacation leave must be approved by your manager at least two weeks in advance.
-    """, styles['Normal']))
+    """),
     
-    content.append(Paragraph("5.2 Sick Leave", styles['Heading2']))
-    content.append(Paragraph("""
+    ('Heading2', "5.2 Sick Leave"),
+    ('Normal', """
     Full-time employees receive 8 sick days per year, accrued monthly.
     
     Part-time employees who work at least 20 hours per week receive sick leave on a pro-rated 
@@ -124,10 +153,10 @@ def create_company_handbook():
     
     Sick leave may be used for personal illness, medical appointments, or to care for an immediate 
     family member who is ill.
-    """, styles['Normal']))
+    """),
     
-    content.append(Paragraph("5.3 Parental Leave", styles['Heading2']))
-    content.append(Paragraph("""
+    ('Heading2', "5.3 Parental Leave"),
+    ('Normal', """
     Full-time employees with at least one year of service are eligible for parental leave:
     • Birth parents: 12 weeks of paid leave
     • Non-birth parents: 6 weeks of paid leave
@@ -136,29 +165,29 @@ def create_company_handbook():
     pro-rated basis according to their standard hours. For example, an employee working 20 hours 
     per week would be eligible for 6 weeks of paid leave for birth parents and 3 weeks for non-birth 
     parents.
-    """, styles['Normal']))
+    """),
     
-    content.append(Paragraph("5.4 Bereavement Leave", styles['Heading2']))
-    content.append(Paragraph("""
+    ('Heading2', "5.4 Bereavement Leave"),
+    ('Normal', """
     All employees, including part-time employees, are eligible for up to 3 days of paid bereavement 
     leave in the event of the death of an immediate family member. Part-time employees will receive 
     bereavement pay based on their scheduled hours during the bereavement period.
-    """, styles['Normal']))
+    """),
     
-    content.append(Paragraph("5.5 Leave of Absence", styles['Heading2']))
-    content.append(Paragraph("""
+    ('Heading2', "5.5 Leave of Absence"),
+    ('Normal', """
     Employees may request an unpaid leave of absence for reasons not covered by other leave policies. 
     Approval is at the discretion of management.
     
     For part-time employees, any leave of absence will be evaluated on a case-by-case basis, with 
     consideration given to the employee's length of service, performance, and the company's needs.
-    """, styles['Normal']))
+    """),
     
     # Benefits
-    content.append(Paragraph("6. Benefits", styles['Heading1']))
+    ('Heading1', "6. Benefits"),
     
-    content.append(Paragraph("6.1 Health Insurance", styles['Heading2']))
-    content.append(Paragraph("""
+    ('Heading2', "6.1 Health Insurance"),
+    ('Normal', """
     Full-time employees are eligible for health, dental, and vision insurance after 30 days of 
     employment. TechCorp covers 80% of the premium for employee coverage.
     
@@ -166,36 +195,111 @@ def create_company_handbook():
     insurance benefits as full-time employees. Part-time employees who work 20-29 hours per week 
     are eligible to participate in the company's health insurance plan, but TechCorp will cover 
     only 50% of the premium for employee coverage.
-    """, styles['Normal']))
+    """),
     
-    content.append(Paragraph("6.2 Retirement Plan", styles['Heading2']))
-    content.append(Paragraph("""
+    ('Heading2', "6.2 Retirement Plan"),
+    ('Normal', """
     All employees, including part-time employees, are eligible to participate in the company's 
     401(k) plan after 90 days of employment. TechCorp matches 50% of employee contributions up 
     to 6% of salary.
-    """, styles['Normal']))
+    """),
     
-    content.append(Paragraph("6.3 Professional Development", styles['Heading2']))
-    content.append(Paragraph("""
+    ('Heading2', "6.3 Professional Development"),
+    ('Normal', """
     TechCorp supports employee growth through professional development opportunities. Full-time 
     employees are eligible for up to $2,000 per year for approved courses, certifications, or 
     conferences.
     
     Part-time employees who work at least 20 hours per week are eligible for professional 
     development benefits on a pro-rated basis according to their standard hours.
-    """, styles['Normal']))
+    """),
     
     # Code of Conduct
-    content.append(Paragraph("7. Code of Conduct", styles['Heading1']))
-    content.append(Paragraph("""
+    ('Heading1', "7. Code of Conduct"),
+    ('Normal', """
     All employees are expected to maintain professional behavior, respect company property, 
     protect confidential information, avoid conflicts of interest, and adhere to all company 
     policies. Violations may result in disciplinary action up to and including termination.
-    """, styles['Normal']))
-    
-    # Build the PDF
-    doc.build(content)
+    """),
+)
+
+def _wrap_lines(text, style, width):
+    font, size = style.fontName, style.fontSize
+    # Like Platypus, let each space shrink a little to squeeze a word in
+    space_shrink = style.spaceShrinkage * stringWidth(" ", font, size)
+    lines = []
+    line = ""
+    spaces = 0
+    for word in text.split():
+        candidate = f"{line} {word}" if line else word
+        if line and stringWidth(candidate, font, size) > width + space_shrink * (spaces + 1):
+            lines.append(line)
+            line = word
+            spaces = 0
+        else:
+            if line:
+                spaces += 1
+            line = candidate
+    if line:
+        lines.append(line)
+    return lines
+
+# Line breaks depend only on the constant text, style and frame width, so
+# each block is wrapped once at import into (style_tag, lines)
+_HANDBOOK_BLOCKS = tuple(
+    (tag, tuple(_wrap_lines(text, _STYLES[tag], FRAME_WIDTH)))
+    for tag, text in _HANDBOOK_SECTIONS
+)
+
+def draw_wrapped(c, lines, x, y, width, style):
+    """Draw pre-wrapped lines below a block top at y and return its bottom."""
+    if style.alignment == TA_CENTER:
+        c.setFont(style.fontName, style.fontSize)
+        for i, line in enumerate(lines):
+            c.drawCentredString(x + width / 2,
+                                y - style.fontSize - i * style.leading, line)
+    else:
+        # One text object per block rather than a drawString per line
+        t = c.beginText(x, y - style.fontSize)
+        t.setFont(style.fontName, style.fontSize, style.leading)
+        t.textLines(lines)
+        c.drawText(t)
+    return y - style.leading * len(lines)
+
+def create_company_handbook():
+    filename = "sample_company_handbook.pdf"
+    # Render in memory and write the finished PDF in a single call
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf, pagesize=letter)
+    
+    y = FRAME_TOP
+    at_top = True
+    space_after = 0
+    for tag, lines in _HANDBOOK_BLOCKS:
+        style = _STYLES[tag]
+        while lines:
+            # Adjacent block spacing collapses to the larger of the two gaps
+            # and is dropped at the top of a page, as in a Platypus frame
+            gap = 0 if at_top else max(space_after, style.spaceBefore)
+            fit = int((y - gap - FRAME_BOTTOM + 1e-6) // style.leading)
+            if fit >= len(lines):
+                y = draw_wrapped(c, lines, FRAME_X, y - gap, FRAME_WIDTH, style)
+                at_top = False
+                space_after = style.spaceAfter
+                break
+            # A paragraph is only split if at least two lines stay behind
+            if fit >= 2:
+                draw_wrapped(c, lines[:fit], FRAME_X, y - gap, FRAME_WIDTH, style)
+                lines = lines[fit:]
+            c.showPage()
+            y = FRAME_TOP
+            at_top = True
+    
+    c.save()
+    pdf_bytes = buf.getvalue()
+    Path(filename).write_bytes(pdf_bytes)
     print(f"Created {filename} successfully")
+    return pdf_bytes
 
 if __name__ == "__main__":
     create_company_handbook()